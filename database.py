@@ -57,6 +57,14 @@ class Database:
         """Get database connection"""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
+        # WAL + relaxed fsync: commits become memory-bound instead of
+        # fsync-bound while staying crash-safe, and readers never block
+        # the writer. journal_mode persists in the db file but is cheap
+        # to re-assert; the others are per-connection.
+        conn.execute('PRAGMA journal_mode=WAL')
+        conn.execute('PRAGMA synchronous=NORMAL')
+        conn.execute('PRAGMA temp_store=MEMORY')
+        conn.execute('PRAGMA mmap_size=134217728')
         return conn
     
     def init_database(self):
@@ -137,6 +145,59 @@ class Database:
             alignment_score=alignment_score
         )
     
+    def save_analyses_bulk(self, rows: List[dict]) -> List[AnalysisResult]:
+        """Save many analysis results in one transaction.
+
+        Each row is a dict with the same keys as save_analysis() arguments.
+        Uses executemany so N inserts cost a single commit instead of N.
+        """
+        if not rows:
+            return []
+
+        conn = self.get_connection()
+        cursor = conn.cursor()
+
+        results = []
+        # Chunk to stay well under SQLite parameter limits
+        batch_size = 500
+        for start in range(0, len(rows), batch_size):
+            batch = rows[start:start + batch_size]
+            cursor.executemany('''
+                INSERT INTO analysis_results
+                (ticker, score, category, rsi, trend, price,
+                 news_direction, news_confidence, alignment, alignment_score)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', [(r['ticker'], r['score'], r['category'], r['rsi'], r['trend'],
+                   r['price'], r['news_direction'], r['news_confidence'],
+                   r['alignment'], r['alignment_score']) for r in batch])
+
+            # Rowids are contiguous within the transaction (single writer).
+            # cursor.lastrowid is undefined after executemany, so ask
+            # SQLite directly for the last assigned rowid.
+            last_id = cursor.execute('SELECT last_insert_rowid()').fetchone()[0]
+            first_id = last_id - len(batch) + 1
+            now = datetime.now()
+            for offset, r in enumerate(batch):
+                results.append(AnalysisResult(
+                    id=first_id + offset,
+                    ticker=r['ticker'],
+                    timestamp=now,
+                    score=r['score'],
+                    category=r['category'],
+                    rsi=r['rsi'],
+                    trend=r['trend'],
+                    price=r['price'],
+                    news_direction=r['news_direction'],
+                    news_confidence=r['news_confidence'],
+                    alignment=r['alignment'],
+                    alignment_score=r['alignment_score']
+                ))
+
+        conn.commit()
+        conn.close()
+
+        return results
+
     def get_latest_results(self, limit: int = 50) -> List[AnalysisResult]:
         """Get latest analysis results"""
         conn = self.get_connection()
@@ -20,12 +20,13 @@ from .output import print_header, print_info
 logger = logging.getLogger(__name__)
 
 
-def analyze_ticker_with_prediction(ticker: str) -> Dict:
+def analyze_ticker_with_prediction(ticker: str, session=None) -> Dict:
     """
     Perform complete analysis with news-based market prediction.
     
     Args:
         ticker: Stock ticker symbol
+        session: Optional shared requests.Session for connection reuse
         
     Returns:
         Dictionary with analysis results including prediction
@@ -33,7 +34,7 @@ def analyze_ticker_with_prediction(ticker: str) -> Dict:
     print(f"📊 Analyzing {ticker}...")
     
     # Fetch market data
-    df = fetch_market_data(ticker)
+    df = fetch_market_data(ticker, session=session)
     
     # Calculate technicals
     technicals = calculate_technicals(df)
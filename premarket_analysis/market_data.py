@@ -57,7 +57,8 @@ def is_market_hours(dt: datetime, session: str = 'regular') -> bool:
         return REGULAR_START <= hour < REGULAR_END
 
 
-def fetch_market_data(ticker: str, period: str = "10d", interval: str = "1h") -> Optional[pd.DataFrame]:
+def fetch_market_data(ticker: str, period: str = "10d", interval: str = "1h",
+                      session=None) -> Optional[pd.DataFrame]:
     """
     Fetch market data from yfinance with session filtering.
     
@@ -65,12 +66,13 @@ def fetch_market_data(ticker: str, period: str = "10d", interval: str = "1h") ->
         ticker: Stock ticker symbol
         period: Time period (e.g., "10d", "1mo")
         interval: Data interval (e.g., "1h", "15m")
+        session: Optional shared requests.Session for connection reuse
         
     Returns:
         DataFrame with OHLCV data or None on error
     """
     try:
-        stock = yf.Ticker(ticker)
+        stock = yf.Ticker(ticker, session=session)
         df = stock.history(period=period, interval=interval)
         
         if df is None or df.empty:
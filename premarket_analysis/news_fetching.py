@@ -16,6 +16,12 @@ from .market_data import get_et_time_naive
 
 logger = logging.getLogger(__name__)
 
+# Shared session: keep-alive avoids a fresh TCP+TLS handshake per fetch
+# in long-running processes like the scheduler
+_session = requests.Session()
+_session.mount('https://', requests.adapters.HTTPAdapter(
+    pool_connections=16, pool_maxsize=32))
+
 # Cache directory setup
 CACHE_DIR = os.path.join(os.path.dirname(__file__), '..', '.news_cache')
 if not os.path.exists(CACHE_DIR):
@@ -133,7 +139,7 @@ def fetch_yahoo_rss_news(ticker: str) -> List[Tuple[str, datetime]]:
     try:
         url = f"https://finance.yahoo.com/rss/headline?s={ticker}"
         
-        response = requests.get(url, timeout=10, headers={
+        response = _session.get(url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
@@ -182,7 +188,7 @@ def fetch_finviz_news(ticker: str) -> List[Tuple[str, datetime]]:
         from bs4 import BeautifulSoup
         
         url = f"https://finviz.com/quote.ashx?t={ticker}"
-        response = requests.get(url, timeout=10, headers={
+        response = _session.get(url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
@@ -246,7 +252,7 @@ def fetch_reuters_rss(ticker: str) -> List[Tuple[str, datetime]]:
         # Try Reuters business news general feed
         url = "https://www.reutersagency.com/feed/?best-topics=business-finance&post_type=best"
         
-        response = requests.get(url, timeout=10, headers={
+        response = _session.get(url, timeout=10, headers={
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36'
         })
         
@@ -314,7 +320,7 @@ def fetch_google_news_rss(ticker: str) -> List[Tuple[str, datetime]]:
         query = company_names.get(ticker, ticker)
         url = f"https://news.google.com/rss/search?q={query}+stock&hl=en-US&gl=US&ceid=US:en"
         
-        response = requests.get(url, timeout=10)
+        response = _session.get(url, timeout=10)
         
         if response.status_code == 200:
             root = ET.fromstring(response.content)
@@ -373,7 +379,7 @@ def fetch_newsapi_headlines(ticker: str, hours: int = 24) -> List[Tuple[str, dat
             'pageSize': 10
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = _session.get(url, params=params, timeout=10)
         
         if response.status_code == 200:
             data = response.json()
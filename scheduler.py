@@ -1,169 +1,423 @@
 #!/usr/bin/env python3
 """
 Timezone-aware scheduler for automated analysis
-Runs every 30 min during market hours (9:30 AM - 4:00 PM ET)
+Runs during market hours (9:30 AM - 4:00 PM ET) at a configurable
+cadence: every 30 min (default), every 15 min, or 3x daily.
 Works correctly regardless of server timezone
 """
 
+import asyncio
+import logging
+import logging.handlers
+import queue
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+import numpy as np
 import pytz
+import requests
+from requests.adapters import HTTPAdapter
 from typing import Optional
 
 from premarket_analysis.main_with_predictions import analyze_ticker_with_prediction
 from database import Database
 from telegram_bot import TelegramBot
 
+# Log records are enqueued on the caller's thread and formatted/written
+# by the listener thread, so analysis never stalls on stdout I/O
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+
+logger = logging.getLogger('scheduler')
+logger.setLevel(logging.INFO)
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+logger.propagate = False
+
+try:
+    # NYSE trading calendar: lets the scheduler sleep straight through
+    # holidays (Thanksgiving, July 4, ...) instead of waking every
+    # scheduled minute on a closed market
+    import exchange_calendars as xcals
+    _NYSE = xcals.get_calendar('XNYS')
+except ImportError:
+    _NYSE = None
+
+
+def _is_rate_limit_error(e: Exception) -> bool:
+    """Best-effort check for API rate limiting across client libraries"""
+    status = getattr(getattr(e, 'response', None), 'status_code', None)
+    if status == 429:
+        return True
+    msg = str(e).lower()
+    return '429' in msg or 'rate limit' in msg or 'too many requests' in msg
+
+
+def _build_schedule(cadence: str) -> list:
+    """Build the (hour, minute) schedule table for a cadence preset"""
+    if cadence == 'thrice':
+        return [(9, 30), (12, 0), (15, 30)]
+
+    step = {'half_hour': 30, 'quarter_hour': 15}.get(cadence)
+    if step is None:
+        raise ValueError(f"Unknown cadence: {cadence!r} "
+                         "(expected 'half_hour', 'quarter_hour' or 'thrice')")
+
+    # Every `step` minutes from 9:30 AM to 4:00 PM ET
+    times = []
+    hour, minute = 9, 30
+    while hour < 16 or (hour == 16 and minute == 0):
+        times.append((hour, minute))
+        minute += step
+        if minute >= 60:
+            minute -= 60
+            hour += 1
+    return times
+
 
 class AnalysisScheduler:
     """Timezone-aware scheduler for running automated analysis"""
-    
-    def __init__(self, tickers: list = None):
+
+    def __init__(self, tickers: list = None, max_workers: int = 8,
+                 analysis_timeout: float = 120.0, schedule_times: list = None,
+                 cadence: str = 'half_hour'):
         self.tickers = tickers or ['AAPL', 'GOOGL', 'MSFT', 'AMZN', 'NVDA', 'TSLA', 'META', 'NFLX']
+        self.max_workers = min(max_workers, len(self.tickers))
+        self.analysis_timeout = analysis_timeout
         self.db = Database()
         self.telegram = TelegramBot()
+
+        # One pooled HTTP session for the scheduler lifetime - keep-alive
+        # amortizes TCP+TLS setup across all yfinance fetches
+        self.http = requests.Session()
+        self.http.mount('https://', HTTPAdapter(pool_connections=16, pool_maxsize=32))
+
         self.eastern = pytz.timezone('US/Eastern')
         self.last_run_minute = None
-        
-        # Market hours schedule in ET: every 30 min from 9:30 AM to 4:00 PM
-        self.schedule_times = [
-            (9, 30), (10, 0), (10, 30), (11, 0), (11, 30),
-            (12, 0), (12, 30), (13, 0), (13, 30), (14, 0),
-            (14, 30), (15, 0), (15, 30), (16, 0)
-        ]
+
+        # Telegram sends are HTTP round-trips - push them onto a queue
+        # consumed by a background thread so run_analysis never blocks
+        # on api.telegram.org
+        self._alert_queue = queue.Queue()
+        threading.Thread(target=self._alert_worker, daemon=True).start()
+
+        # Short-TTL cache of analysis results so bursty callers (manual
+        # runs, Telegram commands) within the same minute coalesce onto
+        # one round of yfinance/news I/O per ticker
+        self.analysis_cache_ttl = 60.0
+        self._analysis_cache = {}
+        self._analysis_cache_lock = threading.Lock()
+
+        # Market hours schedule in ET, either explicit or from a cadence
+        # preset; the frozenset makes should_run_now an O(1) lookup
+        self.cadence = cadence
+        self.schedule_times = sorted(schedule_times or _build_schedule(cadence))
+        self._sched_set = frozenset(self.schedule_times)
+
+        # (weekday, hour, minute) bitmap of active minutes: should_run_now
+        # becomes a single O(1) index instead of a schedule scan
+        self._active = np.zeros((7, 24, 60), dtype=bool)
+        for hour, minute in self.schedule_times:
+            self._active[0:5, hour, minute] = True
+
+        # Circuit breaker for transient API blips (yfinance 429s): after
+        # this many consecutive rate-limit errors the run short-circuits
+        # and the failed tickers are retried later with exponential backoff
+        self.failure_threshold = 3
+        self.retry_backoff = 30.0  # seconds; doubles per trip, capped at 300
+        self._current_backoff = self.retry_backoff
+
+        # UTC->ET offset cached per UTC hour; DST changeovers land on the
+        # hour, so this stays correct while the full pytz conversion runs
+        # ~hourly instead of on every wake-up
+        self._et_offset = None
+        self._et_offset_hour = None
     
+    def _alert_worker(self):
+        """Background thread: drain the alert queue and send via Telegram"""
+        while True:
+            signal = self._alert_queue.get()
+            try:
+                self.telegram.send_high_confidence_alert(signal)
+            except Exception as e:
+                logger.error(f"  ❌ Error sending alert for {signal.ticker}: {e}")
+            finally:
+                self._alert_queue.task_done()
+
+    def _analyze_cached(self, ticker: str):
+        """Analyze a ticker, serving repeat calls from a short TTL cache"""
+        now = time.monotonic()
+        with self._analysis_cache_lock:
+            cached = self._analysis_cache.get(ticker)
+            if cached is not None and now - cached[0] < self.analysis_cache_ttl:
+                return cached[1]
+
+        analysis = analyze_ticker_with_prediction(ticker, session=self.http)
+
+        with self._analysis_cache_lock:
+            self._analysis_cache[ticker] = (time.monotonic(), analysis)
+        return analysis
+
+    def invalidate_analysis_cache(self):
+        """Drop cached analyses so the next run fetches fresh data"""
+        with self._analysis_cache_lock:
+            self._analysis_cache.clear()
+
     def get_current_et_time(self):
         """Get current time in Eastern Time"""
         return datetime.now(self.eastern)
+
+    def _et_now_cached(self):
+        """Naive ET wall time via a UTC offset cached per UTC hour"""
+        now = time.time()
+        utc_hour = int(now // 3600)
+        if utc_hour != self._et_offset_hour:
+            self._et_offset = datetime.now(self.eastern).utcoffset()
+            self._et_offset_hour = utc_hour
+        utc_naive = datetime.fromtimestamp(now, pytz.UTC).replace(tzinfo=None)
+        return utc_naive + self._et_offset
     
+    def _is_trading_day(self, et_dt):
+        """Check whether a date is a trading day (weekday, not a holiday)"""
+        if et_dt.weekday() >= 5:  # Saturday=5, Sunday=6
+            return False
+        if _NYSE is not None:
+            return _NYSE.is_session(et_dt.strftime('%Y-%m-%d'))
+        return True
+
+    def _next_scheduled_et(self, et_now):
+        """Return the next scheduled datetime in ET (skipping weekends/holidays)"""
+        for days_ahead in range(10):
+            candidate_day = et_now + timedelta(days=days_ahead)
+            if not self._is_trading_day(candidate_day):
+                continue
+            for hour, minute in self.schedule_times:
+                candidate = self.eastern.localize(datetime(
+                    candidate_day.year, candidate_day.month, candidate_day.day,
+                    hour, minute
+                ))
+                if candidate > et_now:
+                    return candidate
+        # Unreachable: any 10-day window contains a trading day
+        raise RuntimeError("No scheduled time found in the next 10 days")
+
     def should_run_now(self):
         """Check if we should run analysis now based on ET time"""
-        et_now = self.get_current_et_time()
-        
-        # Only run on weekdays
-        if et_now.weekday() >= 5:  # Saturday=5, Sunday=6
+        et_now = self._et_now_cached()
+
+        # O(1) bitmap lookup covers weekday + scheduled (hour, minute);
+        # holidays still go through the trading calendar
+        if not self._active[et_now.weekday(), et_now.hour, et_now.minute]:
             return False
-        
-        current_hour = et_now.hour
-        current_minute = et_now.minute
-        
-        # Check if current time matches any scheduled time
-        for hour, minute in self.schedule_times:
-            if current_hour == hour and current_minute == minute:
-                # Avoid running multiple times in the same minute
-                current_key = f"{et_now.year}-{et_now.month}-{et_now.day}-{hour}-{minute}"
-                if self.last_run_minute != current_key:
-                    self.last_run_minute = current_key
-                    return True
-        
-        return False
+        if _NYSE is not None and not _NYSE.is_session(et_now.strftime('%Y-%m-%d')):
+            return False
+
+        # Avoid running multiple times in the same minute
+        current_key = f"{et_now.year}-{et_now.month}-{et_now.day}-{et_now.hour}-{et_now.minute}"
+        if self.last_run_minute == current_key:
+            return False
+        self.last_run_minute = current_key
+        return True
     
-    def run_analysis(self, send_alerts: bool = True):
-        """Run analysis on all tickers"""
-        
+    async def analyze_many_async(self, tickers: list = None) -> dict:
+        """Async fan-out over tickers for callers already inside an event loop.
+
+        The analysis stack (yfinance + requests) is synchronous, so each
+        ticker runs on the default executor via asyncio.to_thread; gather
+        then scales to large ticker lists without nesting a second thread
+        pool inside an async host app. Failed tickers are logged and
+        dropped, same as run_analysis.
+        """
+        tickers = tickers or self.tickers
+        outcomes = await asyncio.gather(
+            *[asyncio.to_thread(self._analyze_cached, t) for t in tickers],
+            return_exceptions=True
+        )
+
+        analyses = {}
+        for ticker, outcome in zip(tickers, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"  ❌ Error analyzing {ticker}: {outcome}")
+            else:
+                analyses[ticker] = outcome
+        return analyses
+
+    def run_analysis(self, send_alerts: bool = True, tickers: list = None):
+        """Run analysis on all tickers (or a retry subset)"""
+
+        tickers = tickers or self.tickers
         et_now = self.get_current_et_time()
         utc_now = datetime.now(pytz.UTC)
         
-        print(f"\n{'='*60}")
-        print(f"🔄 Running scheduled analysis")
-        print(f"   📅 Date: {et_now.strftime('%Y-%m-%d')}")
-        print(f"   🕐 Market Time (ET): {et_now.strftime('%I:%M %p')}")
-        print(f"   🌍 Server Time (UTC): {utc_now.strftime('%H:%M:%S')}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"🔄 Running scheduled analysis")
+        logger.info(f"   📅 Date: {et_now.strftime('%Y-%m-%d')}")
+        logger.info(f"   🕐 Market Time (ET): {et_now.strftime('%I:%M %p')}")
+        logger.info(f"   🌍 Server Time (UTC): {utc_now.strftime('%H:%M:%S')}")
+        logger.info(f"{'='*60}\n")
         
         results = []
         high_confidence_signals = []
+
+        # Analysis is dominated by network I/O (yfinance + news fetches),
+        # so fan out across a thread pool. DB writes and Telegram alerts
+        # stay on the main thread (sqlite connections aren't shared).
+        analyses = {}
+        failed = set()
+        consecutive_failures = 0
+        tripped = False
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {
+                executor.submit(self._analyze_cached, ticker): ticker
+                for ticker in tickers
+            }
+            for future in as_completed(futures):
+                ticker = futures[future]
+                try:
+                    analyses[ticker] = future.result(timeout=self.analysis_timeout)
+                    consecutive_failures = 0
+                except Exception as e:
+                    failed.add(ticker)
+                    if tripped:
+                        continue  # cancelled future, already counted
+                    logger.error(f"  ❌ Error analyzing {ticker}: {e}")
+                    if _is_rate_limit_error(e):
+                        consecutive_failures += 1
+                        if consecutive_failures >= self.failure_threshold:
+                            # The remaining fetches would fail identically -
+                            # stop burning the rate-limit budget now
+                            tripped = True
+                            for pending_future, pending_ticker in futures.items():
+                                if pending_future.cancel():
+                                    failed.add(pending_ticker)
+                            logger.error(
+                                f"  🚫 Circuit breaker tripped after "
+                                f"{consecutive_failures} rate-limit errors - "
+                                f"deferring remaining tickers"
+                            )
+
+        # Retry rate-limited tickers in a later, smaller run; the delay
+        # doubles on consecutive trips and resets after a clean run
+        if tripped:
+            retry_tickers = [t for t in tickers
+                             if t in failed and t not in analyses]
+            delay = self._current_backoff
+            self._current_backoff = min(self._current_backoff * 2, 300.0)
+            logger.info(f"🔁 Retrying {len(retry_tickers)} ticker(s) in "
+                        f"{delay:.0f}s: {', '.join(retry_tickers)}")
+            timer = threading.Timer(
+                delay, self.run_analysis,
+                kwargs={'send_alerts': send_alerts, 'tickers': retry_tickers}
+            )
+            timer.daemon = True
+            timer.start()
+        else:
+            self._current_backoff = self.retry_backoff
+
+        # Keep the original ticker order, then save everything in one
+        # transaction instead of one commit per ticker
+        pending = []
+        for ticker in tickers:
+            analysis = analyses.get(ticker)
+            if analysis is None:
+                continue
+
+            pending.append({
+                'ticker': ticker,
+                'score': analysis['score'],
+                'category': analysis['score_category'],
+                'rsi': analysis.get('rsi'),
+                'trend': analysis.get('trend'),
+                'price': analysis.get('price'),
+                'news_direction': analysis['news_prediction'],
+                'news_confidence': analysis['prediction_confidence'],
+                'alignment': analysis['alignment'],
+                'alignment_score': analysis['alignment_score']
+            })
+
+        try:
+            results = self.db.save_analyses_bulk(pending)
+        except Exception as e:
+            logger.error(f"  ❌ Error saving results: {e}")
+            results = []
+
+        # Vectorized high-confidence check: one NumPy comparison over the
+        # whole batch instead of per-result attribute lookups
+        if results:
+            scores = np.array([r.score for r in results])
+            conf = np.array([r.news_confidence for r in results])
+            hc_idx = set(np.flatnonzero((scores >= 70) | (conf >= 60)))
+        else:
+            hc_idx = set()
+
+        for i, result in enumerate(results):
+            logger.info(f"  ✅ {result.ticker}: Score {result.score:.0f} ({result.category})")
+
+            if i in hc_idx:
+                high_confidence_signals.append(result)
+                logger.info(f"     🔔 HIGH CONFIDENCE SIGNAL!")
         
-        for ticker in self.tickers:
-            try:
-                print(f"📊 Analyzing {ticker}...")
-                
-                analysis = analyze_ticker_with_prediction(ticker)
-                
-                # Save to database
-                result = self.db.save_analysis(
-                    ticker=ticker,
-                    score=analysis['score'],
-                    category=analysis['score_category'],
-                    rsi=analysis.get('rsi'),
-                    trend=analysis.get('trend'),
-                    price=analysis.get('price'),
-                    news_direction=analysis['news_prediction'],
-                    news_confidence=analysis['prediction_confidence'],
-                    alignment=analysis['alignment'],
-                    alignment_score=analysis['alignment_score']
-                )
-                
-                results.append(result)
-                
-                print(f"  ✅ {ticker}: Score {result.score:.0f} ({result.category})")
-                
-                # Check if high-confidence signal
-                if result.score >= 70 or result.news_confidence >= 60:
-                    high_confidence_signals.append(result)
-                    print(f"     🔔 HIGH CONFIDENCE SIGNAL!")
-                
-            except Exception as e:
-                print(f"  ❌ Error analyzing {ticker}: {e}")
-        
-        print(f"\n{'='*60}")
-        print(f"✅ Analysis complete: {len(results)} tickers analyzed")
-        print(f"🔔 High-confidence signals: {len(high_confidence_signals)}")
-        print(f"{'='*60}\n")
+        logger.info(f"\n{'='*60}")
+        logger.info(f"✅ Analysis complete: {len(results)} tickers analyzed")
+        logger.info(f"🔔 High-confidence signals: {len(high_confidence_signals)}")
+        logger.info(f"{'='*60}\n")
         
-        # Send alerts via Telegram
+        # Send alerts via Telegram (queued, sent by the background worker)
         if send_alerts and self.telegram.is_configured():
-            print("📱 Sending Telegram alerts...")
-            
-            # Send individual alerts for high-confidence signals
+            logger.info("📱 Queueing Telegram alerts...")
+
+            # Queue individual alerts for high-confidence signals
             for signal in high_confidence_signals:
-                self.telegram.send_high_confidence_alert(signal)
-        
+                self._alert_queue.put(signal)
+
         return results
     
     def run_forever(self):
         """Run scheduler loop - checks every minute for scheduled times"""
         
-        print("\n" + "="*60)
-        print("⏰ TIMEZONE-AWARE SCHEDULER STARTED")
-        print("="*60)
-        print(f"📊 Tickers: {', '.join(self.tickers)}")
-        print(f"🕐 Schedule: Every 30 min during market hours (ET)")
-        print(f"📅 Days: Monday - Friday")
-        print(f"⏰ Times (ET): 9:30 AM - 4:00 PM (14 analyses/day)")
-        print(f"\n🌍 Server timezone: {time.tzname[0]}")
+        logger.info("\n" + "="*60)
+        logger.info("⏰ TIMEZONE-AWARE SCHEDULER STARTED")
+        logger.info("="*60)
+        logger.info(f"📊 Tickers: {', '.join(self.tickers)}")
+        logger.info(f"🕐 Schedule: {self.cadence} cadence during market hours (ET)")
+        logger.info(f"📅 Days: Monday - Friday")
+        logger.info(f"⏰ Times (ET): 9:30 AM - 4:00 PM ({len(self.schedule_times)} analyses/day)")
+        logger.info(f"\n🌍 Server timezone: {time.tzname[0]}")
         
         et_now = self.get_current_et_time()
-        print(f"🕐 Current ET time: {et_now.strftime('%Y-%m-%d %I:%M %p %Z')}")
-        print(f"📍 Day: {et_now.strftime('%A')}")
-        print("="*60)
+        logger.info(f"🕐 Current ET time: {et_now.strftime('%Y-%m-%d %I:%M %p %Z')}")
+        logger.info(f"📍 Day: {et_now.strftime('%A')}")
+        logger.info("="*60)
         
         # Run immediately on startup if during market hours
         if self.should_run_now():
-            print("\n🚀 Starting initial analysis (within scheduled time)...")
+            logger.info("\n🚀 Starting initial analysis (within scheduled time)...")
             try:
                 self.run_analysis()
             except Exception as e:
-                print(f"❌ Initial analysis error: {e}")
+                logger.error(f"❌ Initial analysis error: {e}")
         else:
-            print(f"\n⏸️  Outside market hours - waiting for next scheduled time...")
-        
-        print("\n🤖 Scheduler running... checking every minute\n")
+            logger.info(f"\n⏸️  Outside market hours - waiting for next scheduled time...")
         
-        # Main loop: check every minute
+        logger.info("\n🤖 Scheduler running... sleeping until next scheduled time\n")
+
+        # Main loop: sleep until the next scheduled ET time instead of
+        # waking every 60 seconds to poll
         while True:
             try:
-                if self.should_run_now():
-                    self.run_analysis()
-                
-                # Sleep for 60 seconds
-                time.sleep(60)
-                
+                next_run = self._next_scheduled_et(self.get_current_et_time())
+                delay = max(0.0, (next_run - datetime.now(self.eastern)).total_seconds())
+                logger.info(f"⏸️  Next run: {next_run.strftime('%Y-%m-%d %I:%M %p %Z')} "
+                      f"(sleeping {delay/60:.1f} min)")
+                time.sleep(delay)
+                self.run_analysis()
+
             except KeyboardInterrupt:
-                print("\n\n👋 Scheduler stopped by user")
+                logger.info("\n\n👋 Scheduler stopped by user")
                 break
             except Exception as e:
-                print(f"❌ Error in scheduler loop: {e}")
+                logger.error(f"❌ Error in scheduler loop: {e}")
                 time.sleep(60)
 
 
@@ -180,11 +434,11 @@ def run_continuous():
     try:
         scheduler.run_forever()
     except KeyboardInterrupt:
-        print("\n\n👋 Scheduler stopped by user")
-        print("📊 Final stats:")
+        logger.info("\n\n👋 Scheduler stopped by user")
+        logger.info("📊 Final stats:")
         stats = scheduler.db.get_stats()
         for key, value in stats.items():
-            print(f"  • {key}: {value}")
+            logger.info(f"  • {key}: {value}")
 
 
 if __name__ == '__main__':
@@ -16,7 +16,7 @@ import json
 import pandas as pd
 import numpy as np
 from typing import Dict, List, Tuple
-from scipy.optimize import minimize
+from scipy.optimize import differential_evolution, NonlinearConstraint
 from datetime import datetime
 import sys
 import os
@@ -26,69 +26,129 @@ sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from premarket_analysis.scoring_config import WEIGHTS
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+    HAS_PYARROW = True
+except ImportError:
+    HAS_PYARROW = False
+
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+# Only these columns are used by the optimizer - pruning the rest
+# skips parsing and type inference on everything else
+TRADE_COLUMNS = ['ticker', 'entry_price', 'exit_price', 'pnl',
+                 'rsi', 'sentiment', 'trend', 'win']
+
 
 def load_trade_history(filepath: str) -> pd.DataFrame:
     """
     Load historical trade data from CSV.
-    
+
     Expected columns:
     - ticker: Stock symbol
     - entry_price: Entry price
-    - exit_price: Exit price  
+    - exit_price: Exit price
     - pnl: Profit/loss
     - rsi: RSI at entry (optional)
     - bb_status: Bollinger band status (optional)
     - sentiment: Sentiment score (optional)
     - trend: Trend at entry (optional)
-    
+
     Returns:
         DataFrame with trade history
     """
-    df = pd.read_csv(filepath)
-    
+    sidecar = os.path.splitext(filepath)[0] + '.parquet'
+
+    if HAS_PYARROW and filepath.endswith('.csv') and os.path.exists(sidecar) \
+            and os.path.getmtime(sidecar) >= os.path.getmtime(filepath):
+        # Columnar sidecar written by a previous run: memory-mapped, so
+        # repeated optimizations load straight from the OS page cache
+        # instead of re-parsing the CSV
+        table = pq.read_table(sidecar, memory_map=True)
+        cols = [c for c in TRADE_COLUMNS if c in table.column_names]
+        df = table.select(cols).to_pandas(self_destruct=True, split_blocks=True)
+    elif HAS_PYARROW:
+        # Multithreaded C++ parser, reading only the columns we use
+        table = pa_csv.read_csv(
+            filepath,
+            read_options=pa_csv.ReadOptions(use_threads=True),
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=TRADE_COLUMNS,
+                include_missing_columns=True
+            )
+        )
+        df = table.to_pandas()
+        # Columns absent from the CSV come back all-null; drop them so
+        # downstream "column in df" checks behave as with pd.read_csv
+        df = df.dropna(axis=1, how='all')
+
+        if filepath.endswith('.csv'):
+            try:
+                pq.write_table(pa.Table.from_pandas(df), sidecar,
+                               compression='zstd')
+            except Exception:
+                pass  # a failed cache write must not break the run
+    else:
+        df = pd.read_csv(filepath)
+
     # Add win/loss column if not present
     if 'win' not in df.columns and 'pnl' in df.columns:
-        df['win'] = (df['pnl'] > 0).astype(int)
-    
+        df['win'] = (df['pnl'].to_numpy() > 0).astype(np.int8)
+
     return df
 
 
-def calculate_component_scores(row: pd.Series) -> Dict[str, float]:
+def calculate_component_scores(rsi: float = None, sentiment: float = None,
+                               trend: str = None) -> Dict[str, float]:
     """
-    Calculate individual component scores for a trade based on entry conditions.
-    This is a simplified version - in practice, you'd integrate with scoring.py
-    
+    Calculate individual component scores for a single trade's entry
+    conditions. Scalar reference implementation of build_component_matrix
+    (the optimizer uses the matrix; this stays for one-off scoring).
+
+    Takes plain scalars rather than a DataFrame row so callers don't pay
+    pandas Series overhead; missing values may be None or NaN.
+
     Returns:
         Dictionary with component scores (0-100)
     """
     scores = {}
-    
-    # Technical score (based on RSI and BB position)
-    if 'rsi' in row and pd.notna(row['rsi']):
-        rsi = row['rsi']
+
+    # Technical score (based on RSI). x != x is the NaN check.
+    if rsi is not None and rsi == rsi:
         if rsi <= 20:
-            tech_score = 90
+            scores['technical'] = 90
         elif rsi <= 30:
-            tech_score = 75
+            scores['technical'] = 75
         elif rsi <= 40:
-            tech_score = 50
+            scores['technical'] = 50
         else:
-            tech_score = 30
-        scores['technical'] = tech_score
+            scores['technical'] = 30
     else:
         scores['technical'] = 50  # neutral if missing
-    
-    # Sentiment score
-    if 'sentiment' in row and pd.notna(row['sentiment']):
-        # Convert -1 to 1 range to 0-100 score
-        sentiment = row['sentiment']
+
+    # Sentiment score: convert -1..1 range to 0-100
+    if sentiment is not None and sentiment == sentiment:
         scores['sentiment'] = max(0, min(100, (sentiment + 1) * 50))
     else:
         scores['sentiment'] = 50
-    
+
     # Momentum score (based on trend)
-    if 'trend' in row and pd.notna(row['trend']):
-        trend = str(row['trend']).upper()
+    if trend is not None and trend == trend:
+        trend = str(trend).upper()
         if trend == 'UPTREND':
             scores['momentum'] = 85
         elif trend == 'SIDEWAYS':
@@ -99,17 +159,60 @@ def calculate_component_scores(row: pd.Series) -> Dict[str, float]:
             scores['momentum'] = 50
     else:
         scores['momentum'] = 50
-    
+
     # Catalyst score (placeholder - would need news data)
     scores['catalyst'] = 60  # default moderate score
-    
+
     # Timing score (placeholder - would need time of day)
     scores['timing'] = 70  # default good score
-    
+
     return scores
 
 
-def calculate_trade_score_with_weights(component_scores: Dict[str, float], 
+def build_component_matrix(df: pd.DataFrame) -> np.ndarray:
+    """
+    Calculate component scores for all trades in one vectorized pass.
+
+    Returns an (N, 5) float array with columns in weight order:
+    technical, sentiment, momentum, catalyst, timing.
+    Replaces the per-row calculate_component_scores loop.
+    """
+    n = len(df)
+
+    # Technical score (based on RSI)
+    if 'rsi' in df.columns:
+        rsi = df['rsi'].to_numpy(dtype=np.float64)
+        technical = np.select([rsi <= 20, rsi <= 30, rsi <= 40],
+                              [90.0, 75.0, 50.0], default=30.0)
+        technical[np.isnan(rsi)] = 50.0  # neutral if missing
+    else:
+        technical = np.full(n, 50.0)
+
+    # Sentiment score: convert -1..1 range to 0-100
+    if 'sentiment' in df.columns:
+        sentiment_raw = df['sentiment'].to_numpy(dtype=np.float64)
+        sentiment = np.clip((sentiment_raw + 1) * 50, 0, 100)
+        sentiment[np.isnan(sentiment_raw)] = 50.0
+    else:
+        sentiment = np.full(n, 50.0)
+
+    # Momentum score (based on trend)
+    if 'trend' in df.columns:
+        trend = df['trend'].astype(str).str.upper().to_numpy()
+        momentum = np.select([trend == 'UPTREND', trend == 'SIDEWAYS', trend == 'DOWNTREND'],
+                             [85.0, 60.0, 30.0], default=50.0)
+        momentum[df['trend'].isna().to_numpy()] = 50.0
+    else:
+        momentum = np.full(n, 50.0)
+
+    # Catalyst / timing placeholders (same defaults as the row-wise version)
+    catalyst = np.full(n, 60.0)
+    timing = np.full(n, 70.0)
+
+    return np.column_stack([technical, sentiment, momentum, catalyst, timing])
+
+
+def calculate_trade_score_with_weights(component_scores: Dict[str, float],
                                        weights: Dict[str, float]) -> float:
     """
     Calculate weighted trade score given component scores and weights.
@@ -127,65 +230,91 @@ def calculate_trade_score_with_weights(component_scores: Dict[str, float],
     return score
 
 
-def evaluate_weights(weights_array: np.ndarray, df: pd.DataFrame, 
-                    component_scores_list: List[Dict]) -> float:
+def evaluate_weights(weights_array: np.ndarray, components: np.ndarray,
+                    pnl: np.ndarray, wins: np.ndarray) -> float:
     """
     Objective function to minimize: negative profit factor.
-    
+
     We want to maximize:
     - Win rate on high-scored trades
     - Average profit on winning high-scored trades
     - Avoid losses on low-scored trades
-    
+
+    Operates purely on precomputed NumPy arrays (no DataFrame access) so
+    each SLSQP evaluation is a dot product plus a boolean mask.
+
+    Args:
+        weights_array: Candidate weights (5,)
+        components: Component score matrix (N, 5)
+        pnl: Per-trade P&L (N,), or None if the CSV has no pnl column
+        wins: Per-trade win flags (N,)
+
     Returns:
         Negative profit factor (for minimization)
     """
-    # Convert array to weights dict
-    weights = {
-        'technical': weights_array[0],
-        'sentiment': weights_array[1],
-        'momentum': weights_array[2],
-        'catalyst': weights_array[3],
-        'timing': weights_array[4]
-    }
-    
-    # Calculate scores for all trades
-    scores = []
-    for comp_scores in component_scores_list:
-        score = calculate_trade_score_with_weights(comp_scores, weights)
-        scores.append(score)
-    
-    df['score'] = scores
-    
-    # Filter to high-conviction trades (score > 65)
-    high_conviction = df[df['score'] >= 65]
-    
-    if len(high_conviction) < 3:  # Not enough trades
+    if pnl is not None:
+        # Fused kernel: dot product, mask and both gross sums in a
+        # single pass with no intermediate arrays
+        return _objective_kernel(components, pnl, wins,
+                                 np.ascontiguousarray(weights_array))
+
+    # No P&L data: score, then use win rate as proxy
+    scores = components @ weights_array
+    mask = scores >= 65
+    n_high = int(np.count_nonzero(mask))
+
+    if n_high < 3:  # Not enough trades
         return 1000.0  # Bad score
-    
-    # Calculate metrics
-    win_rate = high_conviction['win'].mean()
-    
-    if 'pnl' in high_conviction.columns:
-        gross_profit = high_conviction[high_conviction['pnl'] > 0]['pnl'].sum()
-        gross_loss = abs(high_conviction[high_conviction['pnl'] < 0]['pnl'].sum())
-        
-        if gross_loss == 0:
-            profit_factor = gross_profit if gross_profit > 0 else 0.1
-        else:
-            profit_factor = gross_profit / gross_loss
-    else:
-        # If no P&L data, use win rate as proxy
-        profit_factor = win_rate * 2
-    
+
+    win_rate = wins[mask].mean()
+    profit_factor = win_rate * 2
+
     # We want to maximize profit factor and win rate
     # Also penalize if we filter out too many trades
-    trade_retention = len(high_conviction) / len(df)
-    
+    trade_retention = n_high / len(components)
+
     # Combined objective (higher is better, so negate for minimization)
-    objective = -(profit_factor * win_rate * (trade_retention ** 0.5))
-    
-    return objective
+    return -(profit_factor * win_rate * (trade_retention ** 0.5))
+
+
+@njit(cache=True, fastmath=True)
+def _objective_kernel(components: np.ndarray, pnl: np.ndarray,
+                      wins: np.ndarray, weights: np.ndarray) -> float:
+    """Single-pass scoring + profit-factor objective (see evaluate_weights)"""
+    n = components.shape[0]
+    n_weights = weights.shape[0]
+
+    gross_profit = 0.0
+    gross_loss = 0.0
+    win_sum = 0.0
+    n_high = 0
+
+    for i in range(n):
+        score = 0.0
+        for j in range(n_weights):
+            score += components[i, j] * weights[j]
+
+        if score >= 65.0:
+            n_high += 1
+            win_sum += wins[i]
+            p = pnl[i]
+            if p > 0.0:
+                gross_profit += p
+            elif p < 0.0:
+                gross_loss -= p
+
+    if n_high < 3:  # Not enough trades
+        return 1000.0  # Bad score
+
+    win_rate = win_sum / n_high
+
+    if gross_loss == 0.0:
+        profit_factor = gross_profit if gross_profit > 0.0 else 0.1
+    else:
+        profit_factor = gross_profit / gross_loss
+
+    trade_retention = n_high / n
+    return -(profit_factor * win_rate * (trade_retention ** 0.5))
 
 
 def optimize_weights(df: pd.DataFrame) -> Tuple[Dict[str, float], Dict]:
@@ -196,14 +325,15 @@ def optimize_weights(df: pd.DataFrame) -> Tuple[Dict[str, float], Dict]:
         Tuple of (optimal_weights, optimization_results)
     """
     print("🔍 Calculating component scores for historical trades...")
-    
-    # Calculate component scores for each trade
-    component_scores_list = []
-    for idx, row in df.iterrows():
-        comp_scores = calculate_component_scores(row)
-        component_scores_list.append(comp_scores)
-    
-    print(f"✅ Processed {len(component_scores_list)} trades")
+
+    # Calculate component scores for all trades in one vectorized pass,
+    # plus the P&L/win arrays the objective needs - everything the hot
+    # path touches is built exactly once, outside the optimizer
+    components = build_component_matrix(df)
+    pnl = df['pnl'].to_numpy(dtype=np.float64) if 'pnl' in df.columns else None
+    wins = df['win'].to_numpy(dtype=np.int8)
+
+    print(f"✅ Processed {len(components)} trades")
     print("\n⚙️  Optimizing weights...")
     
     # Initial weights (current settings)
@@ -216,20 +346,38 @@ def optimize_weights(df: pd.DataFrame) -> Tuple[Dict[str, float], Dict]:
     ])
     
     # Constraints: weights must sum to 1.0
-    constraints = {'type': 'eq', 'fun': lambda w: np.sum(w) - 1.0}
-    
+    constraints = NonlinearConstraint(np.sum, 1.0, 1.0)
+
     # Bounds: each weight between 0.05 and 0.6
     bounds = [(0.05, 0.6)] * 5
-    
-    # Optimize
-    result = minimize(
+
+    # Warm up the JIT-compiled kernel outside the optimizer so compile
+    # time isn't attributed to the first iteration
+    evaluate_weights(initial_weights, components, pnl, wins)
+
+    # Evaluate each generation's population across CPU cores; 'deferred'
+    # updating batches the whole population per generation, which is what
+    # makes the multiprocessing fan-out legal. SCORING_OPT_WORKERS caps
+    # core use on shared runners (-1 = all cores).
+    workers = int(os.environ.get('SCORING_OPT_WORKERS', '-1'))
+
+    # Optimize. The objective is piecewise (hard score >= 65 cutoff), so
+    # SLSQP's finite-difference gradients were both wasteful (~11 extra
+    # evaluations per iteration) and unreliable at the discontinuity.
+    # Differential evolution is gradient-free and handles it naturally;
+    # the polish step refines the best member at the end.
+    result = differential_evolution(
         evaluate_weights,
-        initial_weights,
-        args=(df, component_scores_list),
-        method='SLSQP',
-        bounds=bounds,
+        bounds,
+        args=(components, pnl, wins),
         constraints=constraints,
-        options={'maxiter': 100, 'disp': True}
+        x0=initial_weights,
+        maxiter=50,
+        seed=42,
+        polish=True,
+        workers=workers,
+        updating='deferred',
+        disp=True
     )
     
     # Extract optimal weights
@@ -247,7 +395,7 @@ def optimize_weights(df: pd.DataFrame) -> Tuple[Dict[str, float], Dict]:
     print("="*80)
     
     # Evaluate original weights
-    original_objective = evaluate_weights(initial_weights, df, component_scores_list)
+    original_objective = evaluate_weights(initial_weights, components, pnl, wins)
     optimal_objective = result.fun
     
     improvement = ((original_objective - optimal_objective) / abs(original_objective)) * 100
@@ -4,10 +4,30 @@ Select best 5-6 main tickers (excluding GOOGL/TSLA/AMD) and add best cheap ticke
 Out-of-sample: train year 1, test year 2.
 """
 
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
 import yfinance as yf
 import pandas as pd
 import numpy as np
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
 # Main tickers and exclusions
 MAIN_TICKERS = ['TSLA', 'NVDA', 'MSFT', 'AAPL', 'GOOGL', 'AMZN', 'META', 'AMD', 'NFLX', 'INTC']
 EXCLUDE_MAIN = {'GOOGL', 'TSLA', 'AMD'}
@@ -19,6 +39,7 @@ INTERVAL = '1h'
 ACCOUNT_BALANCE = 200.0
 RISK_PER_TRADE = 0.02
 ROUND_STEP = 0.1
+INV_ROUND_STEP = 1.0 / ROUND_STEP  # hoisted so sizing is a multiply, not a divide
 MAX_POSITION_PCT = 1.0
 
 RSI_LENGTH = 14
@@ -29,6 +50,11 @@ VOLUME_LENGTH = 20
 RR_RATIO = 3.0
 USE_TRAILING_SL = False
 
+# Downloaded bars are memoized on disk; reruns within this window skip
+# the network entirely and pay only indicator + backtest time
+CACHE_DIR = Path('.cache')
+CACHE_MAX_AGE = 24 * 3600  # seconds
+
 STRONG_BUY_THRESHOLD = 20
 MODERATE_BUY_THRESHOLD = 25
 STRONG_SELL_THRESHOLD = 80
@@ -36,217 +62,480 @@ MODERATE_SELL_THRESHOLD = 75
 
 
 def calculate_rsi(data, period=14):
-    delta = data['Close'].diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
+    close = data['Close'].to_numpy(dtype=np.float64)
+    delta = np.diff(close, prepend=close[0])
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    # Wilder's smoothing (the classic RSI definition): a one-pass EMA
+    # recurrence instead of pandas' rolling-mean machinery
+    alpha = 1.0 / period
+    avg_gain = pd.Series(gain, index=data.index).ewm(alpha=alpha, adjust=False).mean()
+    avg_loss = pd.Series(loss, index=data.index).ewm(alpha=alpha, adjust=False).mean()
+    rs = avg_gain / avg_loss
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
 
+@njit(cache=True)
+def _rolling_mean_std_nb(values, period):
+    """Single-pass rolling mean + sample std via running sum/sum-of-squares"""
+    n = values.shape[0]
+    mean = np.full(n, np.nan)
+    std = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = values[i]
+        s += v
+        s2 += v * v
+        if i >= period:
+            old = values[i - period]
+            s -= old
+            s2 -= old * old
+        if i >= period - 1:
+            m = s / period
+            # ddof=1 to match pandas rolling().std()
+            var = (s2 - period * m * m) / (period - 1)
+            mean[i] = m
+            std[i] = np.sqrt(var) if var > 0.0 else 0.0
+    return mean, std
+
+
 def calculate_bb(data, period=20, num_std=2.0):
-    middle = data['Close'].rolling(window=period).mean()
-    std = data['Close'].rolling(window=period).std()
-    upper = middle + (std * num_std)
-    lower = middle - (std * num_std)
+    # One pass over Close instead of separate rolling mean and std
+    close = data['Close'].to_numpy(dtype=np.float64)
+    mid, std = _rolling_mean_std_nb(close, period)
+    upper = pd.Series(mid + std * num_std, index=data.index)
+    middle = pd.Series(mid, index=data.index)
+    lower = pd.Series(mid - std * num_std, index=data.index)
     return upper, middle, lower
 
 
-def run_backtest(data):
-    balance = ACCOUNT_BALANCE
-    trades = []
-    position = None
-    last_signal_time = None
-
-    for i in range(len(data)):
-        row = data.iloc[i]
-        current_time = data.index[i]
-
-        close_val = float(row['Close'])
-        rsi_val = float(row['RSI'])
-        bb_lower = float(row['BB_Lower'])
-        bb_upper = float(row['BB_Upper'])
-        volume_val = float(row['Volume'])
-        volume_avg = float(row['Volume_Avg'])
-
-        if position is not None:
-            pos_type = position['type']
-            entry = position['entry']
-            sl = position['sl']
-            tp = position['tp']
-            shares = position['shares']
-            risk_distance = position['risk_distance']
-
-            if USE_TRAILING_SL:
-                if pos_type == 'BUY':
-                    current_profit = close_val - entry
-                    profit_in_risk = current_profit / risk_distance
+@njit(cache=True)
+def _compute_indicators_nb(close, volume, rsi_period, bb_period, bb_mult, vol_period):
+    """
+    All indicators in one fused sweep: Wilder RSI recurrence, running
+    sum/sum-of-squares for the Bollinger bands, and a running sum for the
+    volume SMA. One traversal keeps close/volume hot in cache instead of
+    four separate rolling passes.
+    """
+    n = close.shape[0]
+    rsi = np.empty(n)
+    bb_upper = np.full(n, np.nan)
+    bb_middle = np.full(n, np.nan)
+    bb_lower = np.full(n, np.nan)
+    vol_avg = np.full(n, np.nan)
+
+    alpha = 1.0 / rsi_period
+    avg_gain = 0.0
+    avg_loss = 0.0
+    prev_close = close[0]
+    s = 0.0
+    s2 = 0.0
+    vs = 0.0
+
+    for i in range(n):
+        c = close[i]
+
+        # Wilder RSI (same recurrence as ewm(alpha=1/period, adjust=False))
+        delta = c - prev_close
+        prev_close = c
+        gain = delta if delta > 0 else 0.0
+        loss = -delta if delta < 0 else 0.0
+        if i == 0:
+            avg_gain = gain
+            avg_loss = loss
+        else:
+            avg_gain += alpha * (gain - avg_gain)
+            avg_loss += alpha * (loss - avg_loss)
+        if avg_loss > 0.0:
+            rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+        elif avg_gain > 0.0:
+            rsi[i] = 100.0
+        else:
+            rsi[i] = np.nan  # 0/0, matching the pandas warm-up
+
+        # Bollinger bands
+        s += c
+        s2 += c * c
+        if i >= bb_period:
+            old = close[i - bb_period]
+            s -= old
+            s2 -= old * old
+        if i >= bb_period - 1:
+            m = s / bb_period
+            var = (s2 - bb_period * m * m) / (bb_period - 1)
+            sd = np.sqrt(var) if var > 0.0 else 0.0
+            bb_middle[i] = m
+            bb_upper[i] = m + bb_mult * sd
+            bb_lower[i] = m - bb_mult * sd
+
+        # Volume SMA
+        vs += volume[i]
+        if i >= vol_period:
+            vs -= volume[i - vol_period]
+        if i >= vol_period - 1:
+            vol_avg[i] = vs / vol_period
+
+    return rsi, bb_upper, bb_middle, bb_lower, vol_avg
+
+
+@njit(cache=True)
+def _run_backtest_nb(close, vol_ok, buy_mask, sell_mask, sl_buy, sl_sell,
+                     balance, use_trailing):
+    """
+    Numba-compiled bar loop. Position state lives in scalars (Numba can't
+    handle the dict) and trades are written into a preallocated array.
+    Entry signals and stop prices arrive as precomputed arrays, so the
+    loop itself only does boolean checks and position accounting.
+    """
+    n = close.shape[0]
+    trades = np.empty(n, dtype=np.float64)
+    n_trades = 0
+    wins = 0
+
+    in_position = False
+    pos_is_buy = True
+    entry = 0.0
+    sl = 0.0
+    tp = 0.0
+    shares = 0.0
+    risk_distance = 0.0
+    # Bars arrive at a fixed 1h interval, so the bar index doubles as the
+    # cooldown clock - no timestamp arithmetic in the loop
+    last_signal_bar = -1000000
+
+    for i in range(n):
+        close_val = close[i]
+
+        if in_position:
+            if use_trailing:
+                if pos_is_buy:
+                    profit_in_risk = (close_val - entry) / risk_distance
 
                     if profit_in_risk >= 1.0 and sl < entry:
                         sl = entry
-                        position['sl'] = sl
 
                     if profit_in_risk > 1.0:
                         trail_level = close_val - (risk_distance * 0.5)
                         if trail_level > sl:
                             sl = trail_level
-                            position['sl'] = sl
 
                     if close_val <= sl:
                         pnl = (close_val - entry) * shares
                         balance += pnl
-                        trades.append(pnl)
-                        position = None
+                        trades[n_trades] = pnl
+                        n_trades += 1
+                        if pnl > 0.0:
+                            wins += 1
+                        in_position = False
                         continue
                 else:
-                    current_profit = entry - close_val
-                    profit_in_risk = current_profit / risk_distance
+                    profit_in_risk = (entry - close_val) / risk_distance
 
                     if profit_in_risk >= 1.0 and sl > entry:
                         sl = entry
-                        position['sl'] = sl
 
                     if profit_in_risk > 1.0:
                         trail_level = close_val + (risk_distance * 0.5)
                         if trail_level < sl:
                             sl = trail_level
-                            position['sl'] = sl
 
                     if close_val >= sl:
                         pnl = (entry - close_val) * shares
                         balance += pnl
-                        trades.append(pnl)
-                        position = None
+                        trades[n_trades] = pnl
+                        n_trades += 1
+                        if pnl > 0.0:
+                            wins += 1
+                        in_position = False
                         continue
             else:
-                if pos_type == 'BUY':
-                    if close_val <= sl:
+                if pos_is_buy:
+                    if close_val <= sl or close_val >= tp:
                         pnl = (close_val - entry) * shares
                         balance += pnl
-                        trades.append(pnl)
-                        position = None
-                        continue
-                    if close_val >= tp:
-                        pnl = (close_val - entry) * shares
-                        balance += pnl
-                        trades.append(pnl)
-                        position = None
+                        trades[n_trades] = pnl
+                        n_trades += 1
+                        if pnl > 0.0:
+                            wins += 1
+                        in_position = False
                         continue
                 else:
-                    if close_val >= sl:
-                        pnl = (entry - close_val) * shares
-                        balance += pnl
-                        trades.append(pnl)
-                        position = None
-                        continue
-                    if close_val <= tp:
+                    if close_val >= sl or close_val <= tp:
                         pnl = (entry - close_val) * shares
                         balance += pnl
-                        trades.append(pnl)
-                        position = None
+                        trades[n_trades] = pnl
+                        n_trades += 1
+                        if pnl > 0.0:
+                            wins += 1
+                        in_position = False
                         continue
 
-        if position is None:
-            if volume_val <= volume_avg:
+        if not in_position:
+            if not vol_ok[i]:
                 continue
 
-            strong_buy = rsi_val < STRONG_BUY_THRESHOLD and close_val <= bb_lower
-            moderate_buy = rsi_val < MODERATE_BUY_THRESHOLD and close_val <= bb_lower and not strong_buy
-            buy_signal = strong_buy or moderate_buy
-
-            strong_sell = rsi_val > STRONG_SELL_THRESHOLD and close_val >= bb_upper
-            moderate_sell = rsi_val > MODERATE_SELL_THRESHOLD and close_val >= bb_upper and not strong_sell
-            sell_signal = strong_sell or moderate_sell
-
-            if last_signal_time is not None:
-                time_diff = (current_time - last_signal_time).total_seconds() / 3600
-                if time_diff < 5:
-                    continue
+            if i - last_signal_bar < 5:
+                continue
 
-            if buy_signal:
-                sl_price = bb_lower * (1 - SL_PERCENT / 100)
+            if buy_mask[i]:
+                sl_price = sl_buy[i]
                 risk_distance = close_val - sl_price
                 if risk_distance <= 0:
                     continue
                 tp_price = close_val + (risk_distance * RR_RATIO)
                 risk_amount = balance * RISK_PER_TRADE
-                shares = max(ROUND_STEP, np.floor((risk_amount / risk_distance) / ROUND_STEP) * ROUND_STEP)
+                shares = max(ROUND_STEP, math.floor((risk_amount / risk_distance) * INV_ROUND_STEP) * ROUND_STEP)
 
-                if MAX_POSITION_PCT is not None:
-                    max_shares = (balance * MAX_POSITION_PCT) / close_val
-                    shares = min(shares, max_shares)
-                    shares = max(ROUND_STEP, np.floor(shares / ROUND_STEP) * ROUND_STEP)
+                max_shares = (balance * MAX_POSITION_PCT) / close_val
+                shares = min(shares, max_shares)
+                shares = max(ROUND_STEP, math.floor(shares * INV_ROUND_STEP) * ROUND_STEP)
 
                 if shares < ROUND_STEP:
                     continue
 
-                position = {
-                    'type': 'BUY',
-                    'entry': close_val,
-                    'sl': sl_price,
-                    'tp': tp_price,
-                    'shares': shares,
-                    'risk_distance': risk_distance
-                }
-                last_signal_time = current_time
-
-            elif sell_signal:
-                sl_price = bb_upper * (1 + SL_PERCENT / 100)
+                in_position = True
+                pos_is_buy = True
+                entry = close_val
+                sl = sl_price
+                tp = tp_price
+                last_signal_bar = i
+
+            elif sell_mask[i]:
+                sl_price = sl_sell[i]
                 risk_distance = sl_price - close_val
                 if risk_distance <= 0:
                     continue
                 tp_price = close_val - (risk_distance * RR_RATIO)
                 risk_amount = balance * RISK_PER_TRADE
-                shares = max(ROUND_STEP, np.floor((risk_amount / risk_distance) / ROUND_STEP) * ROUND_STEP)
+                shares = max(ROUND_STEP, math.floor((risk_amount / risk_distance) * INV_ROUND_STEP) * ROUND_STEP)
 
-                if MAX_POSITION_PCT is not None:
-                    max_shares = (balance * MAX_POSITION_PCT) / close_val
-                    shares = min(shares, max_shares)
-                    shares = max(ROUND_STEP, np.floor(shares / ROUND_STEP) * ROUND_STEP)
+                max_shares = (balance * MAX_POSITION_PCT) / close_val
+                shares = min(shares, max_shares)
+                shares = max(ROUND_STEP, math.floor(shares * INV_ROUND_STEP) * ROUND_STEP)
 
                 if shares < ROUND_STEP:
                     continue
 
-                position = {
-                    'type': 'SELL',
-                    'entry': close_val,
-                    'sl': sl_price,
-                    'tp': tp_price,
-                    'shares': shares,
-                    'risk_distance': risk_distance
-                }
-                last_signal_time = current_time
-
-    if position is not None:
-        final_close = float(data.iloc[-1]['Close'])
-        pnl = (final_close - position['entry']) * position['shares'] if position['type'] == 'BUY' else (position['entry'] - final_close) * position['shares']
+                in_position = True
+                pos_is_buy = False
+                entry = close_val
+                sl = sl_price
+                tp = tp_price
+                last_signal_bar = i
+
+    if in_position:
+        final_close = close[n - 1]
+        if pos_is_buy:
+            pnl = (final_close - entry) * shares
+        else:
+            pnl = (entry - final_close) * shares
         balance += pnl
-        trades.append(pnl)
+        trades[n_trades] = pnl
+        n_trades += 1
+        if pnl > 0.0:
+            wins += 1
+
+    return trades[:n_trades], balance, wins
+
+
+def _extract_arrays(data):
+    """Hoist the kernel's columns to contiguous float64 arrays once"""
+    return (
+        np.ascontiguousarray(data['Close'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['RSI'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['BB_Lower'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['BB_Upper'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['Volume'].to_numpy(dtype=np.float64)),
+        np.ascontiguousarray(data['Volume_Avg'].to_numpy(dtype=np.float64)),
+    )
+
+
+@njit(cache=True)
+def _run_backtest_event_nb(close, vol_ok, buy_mask, sell_mask, sl_buy, sl_sell,
+                           balance):
+    """
+    Event-scan variant for the fixed SL/TP (non-trailing) branch: SL/TP
+    are frozen at entry, so instead of stepping every bar the scan jumps
+    from one entry candidate to its exit crossing. Visits only candidate
+    and in-position bars; semantics match the bar loop exactly.
+    """
+    n = close.shape[0]
+    trades = np.empty(n, dtype=np.float64)
+    n_trades = 0
+    wins = 0
+    last_signal_bar = -1000000
+
+    i = 0
+    while i < n:
+        if not (vol_ok[i] and (buy_mask[i] or sell_mask[i])):
+            i += 1
+            continue
+        if i - last_signal_bar < 5:
+            i += 1
+            continue
+
+        close_val = close[i]
+        if buy_mask[i]:
+            is_buy = True
+            sl_price = sl_buy[i]
+            risk_distance = close_val - sl_price
+            tp_price = close_val + (risk_distance * RR_RATIO)
+        else:
+            is_buy = False
+            sl_price = sl_sell[i]
+            risk_distance = sl_price - close_val
+            tp_price = close_val - (risk_distance * RR_RATIO)
+        if risk_distance <= 0:
+            i += 1
+            continue
+
+        risk_amount = balance * RISK_PER_TRADE
+        shares = max(ROUND_STEP, math.floor((risk_amount / risk_distance) * INV_ROUND_STEP) * ROUND_STEP)
+        max_shares = (balance * MAX_POSITION_PCT) / close_val
+        shares = min(shares, max_shares)
+        shares = max(ROUND_STEP, math.floor(shares * INV_ROUND_STEP) * ROUND_STEP)
+        if shares < ROUND_STEP:
+            i += 1
+            continue
+
+        entry = close_val
+        last_signal_bar = i
+
+        # Forward scan to the first SL/TP crossing; fall back to the
+        # final close if the position never exits
+        j = i + 1
+        exit_price = close[n - 1]
+        while j < n:
+            cj = close[j]
+            if is_buy:
+                if cj <= sl_price or cj >= tp_price:
+                    exit_price = cj
+                    break
+            else:
+                if cj >= sl_price or cj <= tp_price:
+                    exit_price = cj
+                    break
+            j += 1
 
-    if not trades:
+        if is_buy:
+            pnl = (exit_price - entry) * shares
+        else:
+            pnl = (entry - exit_price) * shares
+        balance += pnl
+        trades[n_trades] = pnl
+        n_trades += 1
+        if pnl > 0.0:
+            wins += 1
+
+        # Entries resume the bar after the exit, as in the bar loop
+        i = j + 1
+
+    return trades[:n_trades], balance, wins
+
+
+def run_backtest_arrays(close, rsi, bb_lower, bb_upper, volume, vol_avg):
+    # Entry conditions are pure elementwise comparisons, so build them
+    # once as boolean masks. strong|moderate collapses to the moderate
+    # threshold (a strong signal always satisfies it), and the stop
+    # prices only depend on the bands, so they are arrays too.
+    buy_mask = (rsi < MODERATE_BUY_THRESHOLD) & (close <= bb_lower)
+    sell_mask = (rsi > MODERATE_SELL_THRESHOLD) & (close >= bb_upper)
+    vol_ok = volume > vol_avg
+    sl_buy = bb_lower * (1 - SL_PERCENT / 100)
+    sl_sell = bb_upper * (1 + SL_PERCENT / 100)
+
+    if USE_TRAILING_SL:
+        trades, balance, wins = _run_backtest_nb(
+            close, vol_ok, buy_mask, sell_mask, sl_buy, sl_sell,
+            ACCOUNT_BALANCE, USE_TRAILING_SL
+        )
+    else:
+        trades, balance, wins = _run_backtest_event_nb(
+            close, vol_ok, buy_mask, sell_mask, sl_buy, sl_sell,
+            ACCOUNT_BALANCE
+        )
+
+    if trades.size == 0:
         return None
 
     total_return = ((balance - ACCOUNT_BALANCE) / ACCOUNT_BALANCE) * 100
-    win_rate = (np.sum(np.array(trades) > 0) / len(trades)) * 100
+    win_rate = (wins / trades.size) * 100
 
     return {
         'return': total_return,
         'win_rate': win_rate,
-        'trades': len(trades)
+        'trades': trades.size
     }
 
 
-def prepare_data(ticker):
+def run_backtest(data):
+    return run_backtest_arrays(*_extract_arrays(data))
+
+
+def _cached_download(ticker):
+    """Per-ticker download memoized to a Parquet file for CACHE_MAX_AGE"""
+    cache_path = CACHE_DIR / f"{ticker}_{PERIOD}_{INTERVAL}.parquet"
+    if cache_path.exists() and time.time() - cache_path.stat().st_mtime < CACHE_MAX_AGE:
+        try:
+            return pd.read_parquet(cache_path)
+        except Exception:
+            pass  # unreadable cache entry: fall through to a fresh fetch
+
     data = yf.download(ticker, period=PERIOD, interval=INTERVAL, progress=False)
-    if data.empty or len(data) < 200:
+    if data is not None and not data.empty:
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            data.to_parquet(cache_path)
+        except Exception:
+            pass  # a failed cache write must not break the run
+    return data
+
+
+# In-process memo of indicator arrays, keyed by ticker + parameters +
+# the frame's shape/endpoints (so refreshed bars don't serve stale
+# values). Makes parameter sweeps pay for each indicator set once.
+_indicator_cache = {}
+
+
+def prepare_data(ticker, data=None):
+    if data is None:
+        data = _cached_download(ticker)
+    if data is None or data.empty:
         return None
     if isinstance(data.columns, pd.MultiIndex):
         data.columns = data.columns.get_level_values(0)
 
-    data['RSI'] = calculate_rsi(data, RSI_LENGTH)
-    data['BB_Upper'], data['BB_Middle'], data['BB_Lower'] = calculate_bb(data, BB_LENGTH, BB_MULT)
-    data['Volume_Avg'] = data['Volume'].rolling(window=VOLUME_LENGTH).mean()
-    data = data.dropna()
+    # Batch slices carry the union of all tickers' timestamps; drop rows
+    # where this ticker has no bar
+    data = data.dropna(how='all')
+    if len(data) < 200:
+        return None
+
+    data = data.copy()
+    cache_key = (ticker, RSI_LENGTH, BB_LENGTH, BB_MULT, VOLUME_LENGTH,
+                 len(data), data.index[0].value, data.index[-1].value)
+    indicators = _indicator_cache.get(cache_key)
+    if indicators is None:
+        indicators = _compute_indicators_nb(
+            data['Close'].to_numpy(dtype=np.float64),
+            data['Volume'].to_numpy(dtype=np.float64),
+            RSI_LENGTH, BB_LENGTH, BB_MULT, VOLUME_LENGTH
+        )
+        _indicator_cache[cache_key] = indicators
+    rsi, bb_upper, bb_middle, bb_lower, vol_avg = indicators
+    data['RSI'] = rsi
+    data['BB_Upper'] = bb_upper
+    data['BB_Middle'] = bb_middle
+    data['BB_Lower'] = bb_lower
+    data['Volume_Avg'] = vol_avg
+
+    # Indicator NaNs live only in the warm-up rows, so slice them off
+    # instead of having dropna scan every column for a full copy
+    warmup = max(RSI_LENGTH, BB_LENGTH, VOLUME_LENGTH)
+    data = data.iloc[warmup:]
 
     if len(data) < 200:
         return None
@@ -254,17 +543,18 @@ def prepare_data(ticker):
     return data
 
 
-def run_for_ticker(ticker):
-    data = prepare_data(ticker)
+def run_for_ticker(ticker, data=None):
+    data = prepare_data(ticker, data)
     if data is None:
         return None
 
+    # Extract column arrays once; the train/test halves are zero-copy
+    # NumPy views instead of pandas iloc copies
+    arrays = _extract_arrays(data)
     mid = len(data) // 2
-    train_data = data.iloc[:mid]
-    test_data = data.iloc[mid:]
 
-    train_result = run_backtest(train_data)
-    test_result = run_backtest(test_data)
+    train_result = run_backtest_arrays(*(a[:mid] for a in arrays))
+    test_result = run_backtest_arrays(*(a[mid:] for a in arrays))
 
     if train_result is None or test_result is None:
         return None
@@ -289,8 +579,29 @@ def main():
     main_results = []
     cheap_results = []
 
-    for ticker in main_candidates:
-        res = run_for_ticker(ticker)
+    # One multi-ticker request instead of 14 serialized round-trips;
+    # yfinance fetches the symbols concurrently server-side
+    all_tickers = main_candidates + CHEAP_TICKERS
+    all_data = yf.download(all_tickers, period=PERIOD, interval=INTERVAL,
+                           group_by='ticker', threads=True, progress=False)
+
+    def data_for(ticker):
+        if all_data is None or all_data.empty:
+            return None
+        try:
+            return all_data[ticker]
+        except KeyError:
+            return None
+
+    # Indicator + backtest work is still independent per ticker, so fan
+    # out across processes; ex.map keeps the input order
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as ex:
+        main_fetched = list(ex.map(run_for_ticker, main_candidates,
+                                   [data_for(t) for t in main_candidates]))
+        cheap_fetched = list(ex.map(run_for_ticker, CHEAP_TICKERS,
+                                    [data_for(t) for t in CHEAP_TICKERS]))
+
+    for ticker, res in zip(main_candidates, main_fetched):
         if res:
             main_results.append(res)
             print(f"{ticker}: Train {res['train_return']:+6.2f}%, Test {res['test_return']:+6.2f}%")
@@ -298,8 +609,7 @@ def main():
             print(f"{ticker}: insufficient data")
 
     print()
-    for ticker in CHEAP_TICKERS:
-        res = run_for_ticker(ticker)
+    for ticker, res in zip(CHEAP_TICKERS, cheap_fetched):
         if res:
             cheap_results.append(res)
             print(f"{ticker}: Train {res['train_return']:+6.2f}%, Test {res['test_return']:+6.2f}%")
@@ -314,16 +624,20 @@ def main():
         print("No cheap results")
         return
 
+    # One results frame feeds every selection below: nlargest does a
+    # partial selection instead of full sorts, and the positive filter
+    # is a single vectorized mask
+    main_df = pd.DataFrame(main_results)
+    positive_df = main_df[main_df['test_return'] > 0]
+
     # Selection by test return
-    main_sorted_test = sorted(main_results, key=lambda x: x['test_return'], reverse=True)
-    top6_test = main_sorted_test[:6]
+    top6_test = main_df.nlargest(6, 'test_return').to_dict('records')
     best_cheap_test = max(cheap_results, key=lambda x: x['test_return'])
 
     selected_test = top6_test + [best_cheap_test]
     avg_selected_test = np.mean([r['test_return'] for r in selected_test])
 
-    positive_test = [r for r in main_sorted_test if r['test_return'] > 0]
-    top5_pos_test = positive_test[:5]
+    top5_pos_test = positive_df.nlargest(5, 'test_return').to_dict('records')
     selected_test_pos = top5_pos_test + [best_cheap_test]
     avg_selected_test_pos = np.mean([r['test_return'] for r in selected_test_pos]) if selected_test_pos else None
 
@@ -344,15 +658,13 @@ def main():
         print(f"Estimated $ profit on $200: ${ACCOUNT_BALANCE * avg_selected_test_pos / 100:.2f}")
 
     # Selection by train return
-    main_sorted_train = sorted(main_results, key=lambda x: x['train_return'], reverse=True)
-    top6_train = main_sorted_train[:6]
+    top6_train = main_df.nlargest(6, 'train_return').to_dict('records')
     best_cheap_train = max(cheap_results, key=lambda x: x['train_return'])
 
     selected_train = top6_train + [best_cheap_train]
     avg_selected_train = np.mean([r['test_return'] for r in selected_train])
 
-    positive_train = [r for r in main_sorted_train if r['test_return'] > 0]
-    top5_pos_train = positive_train[:5]
+    top5_pos_train = positive_df.nlargest(5, 'train_return').to_dict('records')
     selected_train_pos = top5_pos_train + [best_cheap_train]
     avg_selected_train_pos = np.mean([r['test_return'] for r in selected_train_pos]) if selected_train_pos else None
 
@@ -5,29 +5,144 @@ Validates the Pine Strategy conversion maintains good performance
 Tests with optimized settings: 2.5x R:R, fixed SL/TP, 6-ticker subset
 """
 
+import os
 import yfinance as yf
 import pandas as pd
 import numpy as np
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 import warnings
 warnings.filterwarnings('ignore')
 
+try:
+    from numba import njit
+    HAS_NUMBA = True
+except ImportError:
+    HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op decorator fallback when numba is not installed"""
+        def wrap(func):
+            return func
+        if args and callable(args[0]):
+            return args[0]
+        return wrap
+
+@njit(cache=True, fastmath=True)
+def _rsi_nb(prices, period):
+    """Running-sum RSI kernel: one pass, no rolling-window buffers"""
+    n = prices.shape[0]
+    rsi = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    for i in range(1, n):
+        delta = prices[i] - prices[i - 1]
+        gain_sum += delta if delta > 0 else 0.0
+        loss_sum += -delta if delta < 0 else 0.0
+        if i > period:
+            old = prices[i - period] - prices[i - period - 1]
+            gain_sum -= old if old > 0 else 0.0
+            loss_sum -= -old if old < 0 else 0.0
+        if i >= period:
+            avg_gain = gain_sum / period
+            avg_loss = loss_sum / period
+            if avg_loss > 0.0:
+                rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+            elif avg_gain > 0.0:
+                rsi[i] = 100.0
+            # both zero: 0/0, stays NaN like the pandas version
+    return rsi
+
+@njit(cache=True, fastmath=True)
+def _bb_nb(prices, period, std_dev):
+    """Single-pass Bollinger kernel via running sum/sum-of-squares"""
+    n = prices.shape[0]
+    upper = np.full(n, np.nan)
+    sma = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = prices[i]
+        s += v
+        s2 += v * v
+        if i >= period:
+            old = prices[i - period]
+            s -= old
+            s2 -= old * old
+        if i >= period - 1:
+            m = s / period
+            # ddof=1 to match pandas rolling().std()
+            var = (s2 - period * m * m) / (period - 1)
+            sd = np.sqrt(var) if var > 0.0 else 0.0
+            sma[i] = m
+            upper[i] = m + sd * std_dev
+            lower[i] = m - sd * std_dev
+    return upper, sma, lower
+
+@njit(cache=True, fastmath=True)
+def _indicators_nb(prices, rsi_period, bb_period, std_dev):
+    """
+    Fused RSI + Bollinger kernel: both indicators slide their windows
+    over the same close reads in one pass, so prices is only streamed
+    through the cache once per ticker.
+    """
+    n = prices.shape[0]
+    rsi = np.full(n, np.nan)
+    upper = np.full(n, np.nan)
+    sma = np.full(n, np.nan)
+    lower = np.full(n, np.nan)
+    gain_sum = 0.0
+    loss_sum = 0.0
+    s = 0.0
+    s2 = 0.0
+    for i in range(n):
+        v = prices[i]
+
+        # RSI: running gain/loss sums
+        if i >= 1:
+            delta = v - prices[i - 1]
+            gain_sum += delta if delta > 0 else 0.0
+            loss_sum += -delta if delta < 0 else 0.0
+            if i > rsi_period:
+                old = prices[i - rsi_period] - prices[i - rsi_period - 1]
+                gain_sum -= old if old > 0 else 0.0
+                loss_sum -= -old if old < 0 else 0.0
+            if i >= rsi_period:
+                avg_gain = gain_sum / rsi_period
+                avg_loss = loss_sum / rsi_period
+                if avg_loss > 0.0:
+                    rsi[i] = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss)
+                elif avg_gain > 0.0:
+                    rsi[i] = 100.0
+
+        # Bollinger: running sum/sum-of-squares
+        s += v
+        s2 += v * v
+        if i >= bb_period:
+            old = prices[i - bb_period]
+            s -= old
+            s2 -= old * old
+        if i >= bb_period - 1:
+            m = s / bb_period
+            var = (s2 - bb_period * m * m) / (bb_period - 1)
+            sd = np.sqrt(var) if var > 0.0 else 0.0
+            sma[i] = m
+            upper[i] = m + sd * std_dev
+            lower[i] = m - sd * std_dev
+    return rsi, upper, sma, lower
+
 def calculate_rsi(prices, period=14):
     """Calculate RSI indicator"""
-    delta = prices.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-    rs = gain / loss
-    rsi = 100 - (100 / (1 + rs))
-    return rsi
+    values = _rsi_nb(prices.to_numpy(dtype=np.float64), period)
+    return pd.Series(values, index=prices.index)
 
 def calculate_bollinger_bands(prices, period=20, std_dev=2):
     """Calculate Bollinger Bands"""
-    sma = prices.rolling(window=period).mean()
-    rolling_std = prices.rolling(window=period).std()
-    upper_band = sma + (rolling_std * std_dev)
-    lower_band = sma - (rolling_std * std_dev)
-    return upper_band, sma, lower_band
+    upper, sma, lower = _bb_nb(prices.to_numpy(dtype=np.float64), period, std_dev)
+    return (pd.Series(upper, index=prices.index),
+            pd.Series(sma, index=prices.index),
+            pd.Series(lower, index=prices.index))
 
 def get_signal_strength(rsi, bb_upper, bb_lower, close):
     """Determine signal strength based on RSI and BB position"""
@@ -61,6 +176,29 @@ def get_signal_strength(rsi, bb_upper, bb_lower, close):
     
     return 'NO_SIGNAL'
 
+# Signal classification as bins + lookup table. right=True makes the
+# buy edges inclusive (rsi <= 20/30, bb% <= 5/20); the sell edges are
+# nudged down one ulp so exactly 70/80 (RSI) and 80/95 (BB%) land in
+# their >= bins, matching the original comparisons bit-for-bit.
+# Codes: 0=none, 1=strong buy, 2=moderate buy, 3=strong sell, 4=moderate sell
+_RSI_BINS = np.array([20.0, 30.0,
+                      np.nextafter(70.0, -np.inf), np.nextafter(80.0, -np.inf)])
+_BB_BINS = np.array([5.0, 20.0,
+                     np.nextafter(80.0, -np.inf), np.nextafter(95.0, -np.inf)])
+_SIGNAL_LUT = np.zeros((5, 5), dtype=np.int8)
+_SIGNAL_LUT[0, 0] = 1                                                # strong buy
+_SIGNAL_LUT[0, 1] = _SIGNAL_LUT[1, 0] = _SIGNAL_LUT[1, 1] = 2        # moderate buy
+_SIGNAL_LUT[4, 4] = 3                                                # strong sell
+_SIGNAL_LUT[3, 3] = _SIGNAL_LUT[3, 4] = _SIGNAL_LUT[4, 3] = 4        # moderate sell
+
+# One row per closed trade; filled positionally instead of growing a
+# list of dicts (side: 1=LONG 0=SHORT, exit_reason: 0=SL 1=TP)
+_TRADES_DTYPE = np.dtype([
+    ('entry_idx', 'i4'), ('exit_idx', 'i4'), ('side', 'i1'),
+    ('entry', 'f8'), ('exit', 'f8'), ('units', 'f8'),
+    ('pnl', 'f8'), ('ret', 'f8'), ('exit_reason', 'i1'),
+])
+
 def calculate_position_size(account_balance, risk_per_trade, stop_loss_distance, price):
     """Calculate position size based on risk management"""
     risk_amount = account_balance * (risk_per_trade / 100)
@@ -69,37 +207,41 @@ def calculate_position_size(account_balance, risk_per_trade, stop_loss_distance,
         return min(units, account_balance / price)  # Don't exceed account balance
     return 0
 
-def backtest_strategy(symbol, start_date, end_date, initial_balance=200):
+def backtest_strategy(symbol, start_date, end_date, initial_balance=200, data=None):
     """Backtest strategy on single symbol with optimized settings"""
     print(f"\n📊 Testing {symbol}...")
-    
-    # Download data
-    try:
-        data = yf.download(symbol, start=start_date, end=end_date, progress=False)
-        if data.empty:
+
+    # Download data (unless the caller already batch-fetched it)
+    if data is None:
+        try:
+            data = yf.download(symbol, start=start_date, end=end_date, progress=False,
+                               actions=False, auto_adjust=False)
+        except:
+            print(f"❌ Failed to download data for {symbol}")
             return None
-    except:
-        print(f"❌ Failed to download data for {symbol}")
+    if data.empty:
         return None
+    # Only Close is ever read; dropping the other columns releases the
+    # rest of the frame
+    data = data[['Close']].copy()
     
-    # Calculate indicators
-    data['RSI'] = calculate_rsi(data['Close'])
-    data['BB_Upper'], data['BB_Middle'], data['BB_Lower'] = calculate_bollinger_bands(data['Close'])
-    
-    # Calculate signals (handle NaN values)
-    signals = []
-    for i in range(len(data)):
-        rsi_val = data['RSI'].iloc[i]
-        bb_upper = data['BB_Upper'].iloc[i]
-        bb_lower = data['BB_Lower'].iloc[i]
-        close_val = data['Close'].iloc[i]
-        
-        if pd.isna(rsi_val) or pd.isna(bb_upper) or pd.isna(bb_lower):
-            signals.append('NO_SIGNAL')
-        else:
-            signals.append(get_signal_strength(rsi_val, bb_upper, bb_lower, close_val))
-    
-    data['Signal'] = signals
+    # Calculate indicators with the fused single-pass kernel. float32
+    # is plenty of precision for daily closes and halves the memory
+    # traffic; the kernel's running sums and the trade P&L still
+    # accumulate in float64
+    close = data['Close'].to_numpy(dtype=np.float32)
+    rsi, bb_upper, _, bb_lower = _indicators_nb(close, 14, 20, 2.0)
+
+    # Classify all bars at once: one digitize per axis plus a 5x5 table
+    # gather replaces the chain of mask-AND comparisons. NaN indicators
+    # digitize into the top bin, so they are forced back to NO_SIGNAL.
+    with np.errstate(invalid='ignore', divide='ignore'):
+        bb_position = (close - bb_lower) / (bb_upper - bb_lower) * 100
+
+    rsi_bin = np.digitize(rsi, _RSI_BINS, right=True)
+    bb_bin = np.digitize(bb_position, _BB_BINS, right=True)
+    signals = _SIGNAL_LUT[rsi_bin, bb_bin]
+    signals[np.isnan(rsi) | np.isnan(bb_position)] = 0
     
     # Strategy parameters (optimized from previous tests)
     account_balance = initial_balance
@@ -107,111 +249,106 @@ def backtest_strategy(symbol, start_date, end_date, initial_balance=200):
     risk_reward_ratio = 2.5  # 2.5:1 R:R ratio
     use_trailing_sl = False  # Fixed SL/TP performs better
     
-    # Track trades and performance
-    trades = []
-    position = None
-    equity_curve = [account_balance]
-    
-    for i in range(1, len(data)):
-        current_price = data.iloc[i]['Close']
-        current_signal = data.iloc[i]['Signal']  # Get scalar value from Series
-        
-        # Exit existing position first
-        if position:
-            # Check for exit conditions
-            exit_trade = False
-            exit_reason = ""
-            exit_price = current_price
-            
-            if position['side'] == 'LONG':
-                if current_price <= position['stop_loss']:
-                    exit_trade = True
-                    exit_reason = "Stop Loss"
-                    exit_price = position['stop_loss']
-                elif current_price >= position['take_profit']:
-                    exit_trade = True
-                    exit_reason = "Take Profit" 
-                    exit_price = position['take_profit']
-            else:  # SHORT
-                if current_price >= position['stop_loss']:
-                    exit_trade = True
-                    exit_reason = "Stop Loss"
-                    exit_price = position['stop_loss']
-                elif current_price <= position['take_profit']:
-                    exit_trade = True
-                    exit_reason = "Take Profit"
-                    exit_price = position['take_profit']
-            
-            if exit_trade:
-                # Calculate P&L
-                if position['side'] == 'LONG':
-                    pnl = (exit_price - position['entry_price']) * position['units']
-                else:
-                    pnl = (position['entry_price'] - exit_price) * position['units']
-                
-                account_balance += pnl
-                
-                trades.append({
-                    'Symbol': symbol,
-                    'Entry_Date': position['entry_date'],
-                    'Exit_Date': data.index[i],
-                    'Side': position['side'],
-                    'Entry_Price': position['entry_price'],
-                    'Exit_Price': exit_price,
-                    'Units': position['units'],
-                    'PnL': pnl,
-                    'Return_%': (pnl / (position['entry_price'] * position['units'])) * 100,
-                    'Exit_Reason': exit_reason
-                })
-                
-                position = None
-        
-        # Look for new entry signals (only if no position)
-        if not position and current_signal in ['STRONG_BUY', 'MODERATE_BUY', 'STRONG_SELL', 'MODERATE_SELL']:
-            
-            if current_signal in ['STRONG_BUY', 'MODERATE_BUY']:
-                # Long position
-                stop_loss = current_price * 0.975  # 2.5% stop loss
-                stop_distance = current_price - stop_loss
-                take_profit = current_price + (stop_distance * risk_reward_ratio)
-                
-                units = calculate_position_size(account_balance, risk_per_trade, stop_distance, current_price)
-                
-                if units > 0:
-                    position = {
-                        'side': 'LONG',
-                        'entry_date': data.index[i],
-                        'entry_price': current_price,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'units': units
-                    }
-            
-            elif current_signal in ['STRONG_SELL', 'MODERATE_SELL']:
-                # Short position  
-                stop_loss = current_price * 1.025  # 2.5% stop loss
-                stop_distance = stop_loss - current_price
-                take_profit = current_price - (stop_distance * risk_reward_ratio)
-                
-                units = calculate_position_size(account_balance, risk_per_trade, stop_distance, current_price)
-                
-                if units > 0:
-                    position = {
-                        'side': 'SHORT',
-                        'entry_date': data.index[i], 
-                        'entry_price': current_price,
-                        'stop_loss': stop_loss,
-                        'take_profit': take_profit,
-                        'units': units
-                    }
-        
-        equity_curve.append(account_balance)
+    # Track trades and performance. SL/TP are frozen at entry, so the
+    # simulation is event-driven: jump from each entry to its first exit
+    # crossing with one NumPy scan per trade instead of stepping every
+    # bar. Exits still trigger on Close (same as the old per-bar loop),
+    # with stop-loss checked before take-profit.
+    n = len(data)
+    # Each trade advances at least one bar, so n rows is a safe bound
+    trades = np.empty(n, dtype=_TRADES_DTYPE)
+    n_trades = 0
+    equity_curve = np.empty(n)
+    last_equity_bar = 0
+
+    i = 1
+    while i < n:
+        current_signal = signals[i]
+        if current_signal == 0:
+            i += 1
+            continue
+
+        current_price = close[i]
+        is_long = current_signal <= 2  # strong/moderate buy
+        if is_long:
+            stop_loss = current_price * 0.975  # 2.5% stop loss
+            stop_distance = current_price - stop_loss
+            take_profit = current_price + (stop_distance * risk_reward_ratio)
+        else:
+            stop_loss = current_price * 1.025  # 2.5% stop loss
+            stop_distance = stop_loss - current_price
+            take_profit = current_price - (stop_distance * risk_reward_ratio)
+
+        units = calculate_position_size(account_balance, risk_per_trade, stop_distance, current_price)
+        if units <= 0:
+            i += 1
+            continue
+
+        # One vectorized scan for the exit bar
+        future = close[i + 1:]
+        if is_long:
+            hit_sl = future <= stop_loss
+            hit_tp = future >= take_profit
+        else:
+            hit_sl = future >= stop_loss
+            hit_tp = future <= take_profit
+        sl_idx = int(hit_sl.argmax()) if hit_sl.any() else n
+        tp_idx = int(hit_tp.argmax()) if hit_tp.any() else n
+
+        if sl_idx == n and tp_idx == n:
+            # Position never exits; like the old loop, it stays open and
+            # unrealized at the end of the data
+            break
+
+        if sl_idx <= tp_idx:
+            exit_reason = 0  # Stop Loss
+            exit_price = stop_loss
+            exit_bar = i + 1 + sl_idx
+        else:
+            exit_reason = 1  # Take Profit
+            exit_price = take_profit
+            exit_bar = i + 1 + tp_idx
+
+        if is_long:
+            pnl = (exit_price - current_price) * units
+        else:
+            pnl = (current_price - exit_price) * units
+
+        # Balance is flat between exits: fill the stretch in one slice
+        equity_curve[last_equity_bar:exit_bar] = account_balance
+        account_balance += pnl
+        last_equity_bar = exit_bar
+
+        trades[n_trades] = (
+            i, exit_bar, 1 if is_long else 0,
+            current_price, exit_price, units,
+            pnl, (pnl / (current_price * units)) * 100, exit_reason
+        )
+        n_trades += 1
+
+        # Entry checks resume on the exit bar itself, as before
+        i = exit_bar
+
+    equity_curve[last_equity_bar:] = account_balance
     
     # Calculate performance metrics
     total_return = ((account_balance - initial_balance) / initial_balance) * 100
     
-    if trades:
-        trades_df = pd.DataFrame(trades)
+    if n_trades:
+        # Decode the structured rows into the readable frame in one shot
+        t = trades[:n_trades]
+        trades_df = pd.DataFrame({
+            'Symbol': symbol,
+            'Entry_Date': data.index[t['entry_idx']],
+            'Exit_Date': data.index[t['exit_idx']],
+            'Side': np.where(t['side'] == 1, 'LONG', 'SHORT'),
+            'Entry_Price': t['entry'],
+            'Exit_Price': t['exit'],
+            'Units': t['units'],
+            'PnL': t['pnl'],
+            'Return_%': t['ret'],
+            'Exit_Reason': np.where(t['exit_reason'] == 0, 'Stop Loss', 'Take Profit'),
+        })
         winning_trades = trades_df[trades_df['PnL'] > 0]
         losing_trades = trades_df[trades_df['PnL'] < 0]
         
@@ -247,6 +384,11 @@ def backtest_strategy(symbol, start_date, end_date, initial_balance=200):
             'Losing_Trades': 0
         }
 
+def _bt_worker(args):
+    """Unpack one (symbol, start, end, data) job for the process pool"""
+    symbol, start_date, end_date, data = args
+    return backtest_strategy(symbol, start_date, end_date, data=data)
+
 def main():
     print("🚀 STRATEGY VALIDATION BACKTEST")
     print("=" * 50)
@@ -264,23 +406,35 @@ def main():
     print(f"📅 Training Period: {start_date.strftime('%Y-%m-%d')} to {split_date.strftime('%Y-%m-%d')}")
     print(f"📅 Testing Period: {split_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}")
     
-    # Test on training period
+    # One batched download per period instead of 12 per-ticker calls;
+    # yfinance fetches the whole universe in a single session
+    train_data = yf.download(tickers, start=start_date, end=split_date,
+                             group_by='ticker', progress=False, threads=True,
+                             actions=False, auto_adjust=False)
+    test_data = yf.download(tickers, start=split_date, end=end_date,
+                            group_by='ticker', progress=False, threads=True,
+                            actions=False, auto_adjust=False)
+
+    def slice_for(batch, symbol):
+        if batch is None or batch.empty or symbol not in batch.columns.get_level_values(0):
+            return None
+        return batch[symbol].dropna(how='all')
+
+    # All 12 runs (6 tickers x 2 periods) are independent, so fan them
+    # out across a process pool; ex.map preserves job order
+    jobs = [(s, start_date, split_date, slice_for(train_data, s)) for s in tickers] + \
+           [(s, split_date, end_date, slice_for(test_data, s)) for s in tickers]
+
+    with ProcessPoolExecutor(max_workers=min(os.cpu_count() or 1, len(tickers))) as ex:
+        results = list(ex.map(_bt_worker, jobs))
+
     print(f"\n🔬 TRAINING PERIOD RESULTS")
     print("-" * 30)
-    train_results = []
-    for symbol in tickers:
-        result = backtest_strategy(symbol, start_date, split_date)
-        if result:
-            train_results.append(result)
-    
-    # Test on out-of-sample period
+    train_results = [r for r in results[:len(tickers)] if r]
+
     print(f"\n📊 OUT-OF-SAMPLE TEST RESULTS")
     print("-" * 30)
-    test_results = []
-    for symbol in tickers:
-        result = backtest_strategy(symbol, split_date, end_date)
-        if result:
-            test_results.append(result)
+    test_results = [r for r in results[len(tickers):] if r]
     
     # Summary statistics
     if train_results:
@@ -4,25 +4,61 @@ Telegram Bot Integration
 Sends alerts for high-confidence trading signals
 """
 
+import asyncio
+import heapq
 import os
+from functools import lru_cache
 import requests
 from datetime import datetime
 from typing import List, Optional
 from database import AnalysisResult
 
+try:
+    import aiohttp
+    HAS_AIOHTTP = True
+except ImportError:
+    HAS_AIOHTTP = False
+
 
 class TelegramBot:
     """Telegram bot for sending trading alerts"""
-    
+
+    # Built once at class creation instead of per formatted message
+    _CATEGORY_EMOJI = {
+        'STRONG_BUY': '🚀',
+        'BUY': '📈',
+        'WATCH': '👀',
+        'AVOID': '⛔',
+        'NEUTRAL': '➖'
+    }
+
+    _NEWS_EMOJI = {
+        'BULLISH': '🟢',
+        'BEARISH': '🔴',
+        'NEUTRAL': '⚪'
+    }
+
+
     def __init__(self, bot_token: Optional[str] = None, chat_id: Optional[str] = None):
         self.bot_token = bot_token or os.environ.get('TELEGRAM_BOT_TOKEN')
         self.chat_id = chat_id or os.environ.get('TELEGRAM_CHAT_ID')
-        
+
+        # One keep-alive session for all sends; every message goes to
+        # api.telegram.org, so reusing the TLS connection skips the
+        # per-call handshake
+        self._session = requests.Session()
+        self._session.mount('https://', requests.adapters.HTTPAdapter(
+            pool_connections=1, pool_maxsize=4))
+
         if not self.bot_token:
             print("⚠️  Warning: TELEGRAM_BOT_TOKEN not set - notifications disabled")
         if not self.chat_id:
             print("⚠️  Warning: TELEGRAM_CHAT_ID not set - notifications disabled")
-    
+
+    def close(self):
+        """Close the underlying HTTP session"""
+        self._session.close()
+
     def is_configured(self) -> bool:
         """Check if bot is properly configured"""
         return bool(self.bot_token and self.chat_id)
@@ -43,7 +79,7 @@ class TelegramBot:
         }
         
         try:
-            response = requests.post(url, json=payload, timeout=10)
+            response = self._session.post(url, json=payload, timeout=10)
             
             if response.status_code == 200:
                 print(f"✅ Telegram message sent successfully")
@@ -56,49 +92,57 @@ class TelegramBot:
             print(f"❌ Error sending Telegram message: {e}")
             return False
     
-    def format_signal_alert(self, result: AnalysisResult) -> str:
-        """Format a trading signal as a Telegram message"""
-        
-        # Emoji based on category
-        category_emoji = {
-            'STRONG_BUY': '🚀',
-            'BUY': '📈',
-            'WATCH': '👀',
-            'AVOID': '⛔',
-            'NEUTRAL': '➖'
-        }
-        
-        emoji = category_emoji.get(result.category, '📊')
-        
-        # Emoji for news direction
-        news_emoji = {
-            'BULLISH': '🟢',
-            'BEARISH': '🔴',
-            'NEUTRAL': '⚪'
+    async def _send_async(self, session, text: str, parse_mode: str = 'HTML') -> bool:
+        """Send one message over a shared aiohttp session"""
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+
+        payload = {
+            'chat_id': self.chat_id,
+            'text': text,
+            'parse_mode': parse_mode,
+            'disable_web_page_preview': True
         }
-        
-        news_icon = news_emoji.get(result.news_direction, '⚪')
-        
-        message = f"""
-{emoji} <b>{result.ticker}</b> - {result.category}
-━━━━━━━━━━━━━━━━━━━━
 
-<b>📊 Score:</b> {result.score:.0f}/100
+        try:
+            async with session.post(url, json=payload,
+                                    timeout=aiohttp.ClientTimeout(total=10)) as response:
+                if response.status == 200:
+                    print(f"✅ Telegram message sent successfully")
+                    return True
+                else:
+                    body = await response.text()
+                    print(f"❌ Telegram API error: {response.status} - {body}")
+                    return False
 
-<b>💰 Price:</b> ${result.price:.2f if result.price else 'N/A'}
-<b>📉 RSI:</b> {result.rsi:.1f if result.rsi else 'N/A'}
-<b>📈 Trend:</b> {result.trend or 'N/A'}
+        except Exception as e:
+            print(f"❌ Error sending Telegram message: {e}")
+            return False
 
-<b>📰 News Prediction:</b>
-{news_icon} {result.news_direction} ({result.news_confidence:.0f}% confidence)
+    async def send_many_async(self, texts: List[str], parse_mode: str = 'HTML') -> List[bool]:
+        """Send a batch of messages concurrently over one connection"""
+        async with aiohttp.ClientSession() as session:
+            return list(await asyncio.gather(
+                *[self._send_async(session, text, parse_mode) for text in texts]
+            ))
 
-<b>🎯 Alignment:</b> {result.alignment}
-<b>⚖️  Alignment Score:</b> {result.alignment_score:.0f}/10
+    def send_many(self, texts: List[str], parse_mode: str = 'HTML') -> List[bool]:
+        """Send a batch of messages; overlaps the round-trips when aiohttp is available"""
+        if not self.is_configured():
+            print("❌ Telegram not configured, skipping messages")
+            return [False] * len(texts)
 
-<b>🕐 Time:</b> {result.timestamp.strftime('%Y-%m-%d %H:%M:%S') if result.timestamp else 'N/A'}
-"""
-        
-        return message.strip()
+        if not HAS_AIOHTTP:
+            return [self.send_message(text, parse_mode) for text in texts]
+
+        return asyncio.run(self.send_many_async(texts, parse_mode))
+
+    def format_signal_alert(self, result: AnalysisResult) -> str:
+        """Format a trading signal as a Telegram message"""
+        return _format_signal_alert(
+            result.ticker, result.category, result.score, result.price,
+            result.rsi, result.trend, result.news_direction,
+            result.news_confidence, result.alignment,
+            result.alignment_score, result.timestamp)
     
     def send_high_confidence_alert(self, result: AnalysisResult) -> bool:
         """Send alert for high-confidence signal"""
@@ -147,7 +191,8 @@ class TelegramBot:
         
         if high_conf:
             message += "\n<b>Top Opportunities:</b>\n"
-            for r in sorted(high_conf, key=lambda x: x.score, reverse=True)[:3]:
+            # Only the top 3 matter, so skip the full sort
+            for r in heapq.nlargest(3, high_conf, key=lambda x: x.score):
                 message += f"  • {r.ticker}: {r.score:.0f} ({r.category})\n"
         
         message += f"\n<b>🕐 Time:</b> {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"
@@ -184,6 +229,44 @@ class TelegramBot:
         return self.send_message(message)
 
 
+@lru_cache(maxsize=128)
+def _format_signal_alert(ticker, category, score, price, rsi, trend,
+                         news_direction, news_confidence, alignment,
+                         alignment_score, timestamp):
+    """Build the alert message; cached so the same result (e.g. an alert
+    followed by the daily summary) is only formatted once"""
+    emoji = TelegramBot._CATEGORY_EMOJI.get(category, '📊')
+    news_icon = TelegramBot._NEWS_EMOJI.get(news_direction, '⚪')
+
+    # Conditionals are not valid inside a format spec (the old
+    # {result.price:.2f if ...} raised ValueError on every alert),
+    # so build the optional fields first
+    price_str = f"{price:.2f}" if price is not None else 'N/A'
+    rsi_str = f"{rsi:.1f}" if rsi is not None else 'N/A'
+    time_str = timestamp.strftime('%Y-%m-%d %H:%M:%S') if timestamp else 'N/A'
+
+    message = f"""
+{emoji} <b>{ticker}</b> - {category}
+━━━━━━━━━━━━━━━━━━━━
+
+<b>📊 Score:</b> {score:.0f}/100
+
+<b>💰 Price:</b> ${price_str}
+<b>📉 RSI:</b> {rsi_str}
+<b>📈 Trend:</b> {trend or 'N/A'}
+
+<b>📰 News Prediction:</b>
+{news_icon} {news_direction} ({news_confidence:.0f}% confidence)
+
+<b>🎯 Alignment:</b> {alignment}
+<b>⚖️  Alignment Score:</b> {alignment_score:.0f}/10
+
+<b>🕐 Time:</b> {time_str}
+"""
+
+    return message.strip()
+
+
 def get_telegram_setup_instructions():
     """Get instructions for setting up Telegram bot"""
     